@@ -2,3 +2,13 @@
 The :mod:`jina.proto` defines the protobuf used in jina. It is the core message protocol used in communicating between :class:`jina.peapods.base.BasePod`. It also defines the interface of a gRPC service.
 
 """
+import warnings as _warnings
+
+from google.protobuf.internal import api_implementation as _api_implementation
+
+if _api_implementation.Type() == 'python':
+    _warnings.warn(
+        'protobuf is running with its pure-python backend; (de)serializing requests will be much slower. '
+        'Unset `PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION` (or set it to `upb` on protobuf>=4.21 / `cpp` on 3.x) '
+        'and install a protobuf wheel with the native extension'
+    )
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _import_jina_proto(**env):
+    env = {k: v for k, v in {**os.environ, **env}.items() if v is not None}
+    return subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import jina.proto; '
+            'from google.protobuf.internal import api_implementation; '
+            'print(api_implementation.Type())',
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_proto_pure_python_backend_warning():
+    r = _import_jina_proto(PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION='python')
+    assert r.returncode == 0, r.stderr
+    assert r.stdout.strip() == 'python'
+    assert 'pure-python backend' in r.stderr
+
+
+def test_proto_native_backend_no_warning():
+    r = _import_jina_proto(PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=None)
+    assert r.returncode == 0, r.stderr
+    if r.stdout.strip() == 'python':
+        pytest.skip('no native protobuf backend installed')
+    assert 'pure-python backend' not in r.stderr